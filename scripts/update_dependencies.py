@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import json
 import re
+import shutil
 import subprocess
 import tomllib
 from collections.abc import Mapping
@@ -45,6 +46,7 @@ def run(
 
 CONSTRAINT_RE = re.compile(r"^(.+?)(>=|==|~=|<=|<|!=)([^;\s]+)")
 DEP_LINE_RE = re.compile(r'^(\s+)"([^"]+)"(.*)$')
+NAME_SPLIT_RE = re.compile(r"[<>=!~\[]")
 
 
 def normalized_version(version: str) -> str:
@@ -120,7 +122,7 @@ def update_pyproject_constraints(
 
 
 def pep508_name(spec: str) -> str:
-    name = re.split(r"[<>=!~\[]", spec.split(";", 1)[0].strip(), maxsplit=1)[0].strip()
+    name = NAME_SPLIT_RE.split(spec.split(";", 1)[0].strip(), maxsplit=1)[0].strip()
     return name.lower().replace("_", "-")
 
 
@@ -344,7 +346,7 @@ def main() -> None:
     console.print(Panel.fit("Fleet Manager dependency update", style="bold magenta"))
 
     for tool in ("uv", "npm", "npx"):
-        if subprocess.run(["which", tool], capture_output=True).returncode != 0:
+        if shutil.which(tool) is None:
             console.print(f"[bold red]Required tool not found:[/bold red] {tool}")
             raise SystemExit(1)
 
@@ -1,35 +1,70 @@
 import argparse
-import asyncio
 import contextlib
+import functools
+import json
+import os
+import queue
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Protocol, Tuple, Union, cast
+from types import SimpleNamespace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
-import kubernetes  # type: ignore[import-untyped]
 import rich.box
-
-# Prompt-toolkit imports
-from prompt_toolkit import Application
-from prompt_toolkit.formatted_text import (
-    FormattedText,
-    to_formatted_text,
-)
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.layout import HSplit, Layout, Window
-from prompt_toolkit.layout.controls import FormattedTextControl
-from prompt_toolkit.styles import Style
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
 from kge import __version__
 
+if TYPE_CHECKING:
+    # prompt_toolkit (and the asyncio it pulls in) is only needed by the
+    # interactive selector, so it is imported there rather than on every start,
+    # which keeps --version, --help and shell completion fast.
+    from prompt_toolkit import Application
+    from prompt_toolkit.formatted_text import FormattedText
+
 # Initialize Rich Console
 console = Console()
 
-
-@dataclass
+# How many owner references to follow when resolving an object's top-level owner
+OWNER_RESOLUTION_MAX_LEVEL = 5
+# Default number of concurrent GET requests used to warm the object cache
+# before grouping; override with --max-workers or KGE_MAX_WORKERS
+PREFETCH_WORKERS = 8
+# How long fetched objects and resolved owners are reused across refreshes
+DEFAULT_CACHE_TTL_SECONDS = 30.0
+# Events requested per list call when paging through a namespace
+EVENTS_PAGE_SIZE = 500
+# Server-side timeout for each follow-mode watch request before it is renewed
+WATCH_TIMEOUT_SECONDS = 300
+# Pause before reconnecting a follow-mode watch after an error
+WATCH_RETRY_SECONDS = 5
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 3339 timestamp from a raw API response."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True, frozen=True)
 class KubernetesEvent:
     """Represents a Kubernetes event with all relevant information."""
 
@@ -46,32 +81,25 @@ class KubernetesEvent:
     involved_object_uid: Optional[str]  # UID of the involved_object
 
     @classmethod
-    def from_v1_event(cls, event: Any) -> "KubernetesEvent":
-        """Create a KubernetesEvent from a V1Event object."""
+    def from_event_json(cls, event: Dict[str, Any]) -> "KubernetesEvent":
+        """Create a KubernetesEvent from a raw Event object of a list response."""
+        metadata = event.get("metadata") or {}
+        involved_object = event.get("involvedObject") or {}
+        # Events recorded through events.k8s.io keep their repeat count in
+        # series.count; the legacy count field may be missing or stale.
+        series = event.get("series") or {}
         return cls(
-            namespace=event.metadata.namespace if event.metadata else None,
-            involved_object_name=(
-                event.involved_object.name if event.involved_object else None
-            ),
-            involved_object_kind=(
-                event.involved_object.kind if event.involved_object else None
-            ),
-            reason=event.reason,
-            message=event.message,
-            first_timestamp=event.first_timestamp,
-            last_timestamp=event.last_timestamp,
-            api_version=(
-                event.involved_object.api_version if event.involved_object else None
-            ),
-            type=event.type,
-            count=event.count,
-            involved_object_uid=(
-                str(event.involved_object.uid)
-                if event.involved_object
-                and hasattr(event.involved_object, "uid")
-                and event.involved_object.uid
-                else None
-            ),
+            namespace=metadata.get("namespace"),
+            involved_object_name=involved_object.get("name"),
+            involved_object_kind=involved_object.get("kind"),
+            reason=event.get("reason"),
+            message=event.get("message"),
+            first_timestamp=_parse_timestamp(event.get("firstTimestamp")),
+            last_timestamp=_parse_timestamp(event.get("lastTimestamp")),
+            api_version=involved_object.get("apiVersion"),
+            type=event.get("type"),
+            count=series.get("count") or event.get("count"),
+            involved_object_uid=involved_object.get("uid") or None,
         )
 
     def to_dict(self) -> Dict:
@@ -95,6 +123,52 @@ class KubernetesEvent:
         }
 
 
+# Sort key for events without any timestamp; built once rather than per comparison
+_MIN_TIMESTAMP = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _event_time(event: KubernetesEvent) -> Optional[datetime]:
+    """Return the event's last (or first) timestamp as an aware datetime."""
+    ts = event.last_timestamp or event.first_timestamp
+    if ts is not None and ts.tzinfo is None:
+        return ts.replace(tzinfo=timezone.utc)
+    return ts
+
+
+def _event_sort_key(event: KubernetesEvent) -> datetime:
+    return _event_time(event) or _MIN_TIMESTAMP
+
+
+def _format_reason(event: KubernetesEvent) -> str:
+    """Return the event reason, noting how often the apiserver has seen it."""
+    reason = event.reason or "N/A"
+    if event.count and event.count > 1:
+        return f"{reason} (x{event.count})"
+    return reason
+
+
+def _format_event_time(
+    timestamp: Optional[datetime], now: datetime, show_timestamps: bool
+) -> str:
+    """Format a timestamp as-is or relative to ``now`` (e.g. "5m ago")."""
+    if timestamp is None:
+        return "unknown time"
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    if show_timestamps:
+        return str(timestamp)
+    delta = now - timestamp
+    if delta.total_seconds() < 0:
+        return "in future?"
+    if delta.days > 0:
+        return f"{delta.days}d ago"
+    if delta.seconds >= 3600:
+        return f"{delta.seconds // 3600}h ago"
+    if delta.seconds >= 60:
+        return f"{delta.seconds // 60}m ago"
+    return f"{delta.seconds}s ago"
+
+
 class KubernetesEventSource(Protocol):
     def fetch_events(
         self, namespace: Optional[str] = None
@@ -105,10 +179,47 @@ class KubernetesEventSource(Protocol):
     ) -> Dict[str, Dict[str, Any]]: ...
 
 
+def _object_metadata_from_json(raw: Union[str, bytes]) -> SimpleNamespace:
+    """Build a lightweight object exposing only the fields owner resolution reads.
+
+    Parsing the raw response avoids deserializing full Pod/Deployment models
+    when all we need is kind, identity and owner references.
+    """
+    data = json.loads(raw)
+    metadata = data.get("metadata") or {}
+    owner_references = [
+        SimpleNamespace(
+            kind=ref.get("kind"),
+            name=ref.get("name"),
+            uid=ref.get("uid"),
+            api_version=ref.get("apiVersion"),
+        )
+        for ref in metadata.get("ownerReferences") or []
+    ]
+    return SimpleNamespace(
+        kind=data.get("kind"),
+        metadata=SimpleNamespace(
+            name=metadata.get("name"),
+            namespace=metadata.get("namespace"),
+            uid=metadata.get("uid"),
+            owner_references=owner_references or None,
+        ),
+    )
+
+
 class KubernetesEventManager:
     """Manages Kubernetes events fetching and processing."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_workers: int = PREFETCH_WORKERS,
+        cache_ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+        disable_compression: bool = False,
+    ) -> None:
+        self.max_workers = max_workers
+        self.disable_compression = disable_compression
+        self.cache_ttl = cache_ttl
+        self._cache_started_at = time.monotonic()
         self._object_fetch_cache: Dict[
             Tuple, Optional[Any]
         ] = {}  # Cache for fetched K8s objects
@@ -119,6 +230,10 @@ class KubernetesEventManager:
 
     def _init_kubernetes_client(self) -> None:
         """Initialize the Kubernetes client with proper configuration."""
+        # kubernetes is imported lazily throughout this module: it accounts for
+        # most of the start-up time, and --version/--completion never need it.
+        import kubernetes  # type: ignore[import-untyped]
+
         try:
             # Try to load in-cluster config first
             kubernetes.config.load_incluster_config()
@@ -166,9 +281,16 @@ class KubernetesEventManager:
                 )
 
         try:
-            self.v1 = kubernetes.client.CoreV1Api()
-            self.apps_v1 = kubernetes.client.AppsV1Api()
-            self.batch_v1 = kubernetes.client.BatchV1Api()
+            # Share one ApiClient so every API group reuses the same connection pool
+            self.api_client = kubernetes.client.ApiClient()
+            if not self.disable_compression:
+                # The client does not ask for compression by default. With this
+                # header the apiserver gzips large list responses and urllib3
+                # decodes them.
+                self.api_client.set_default_header("Accept-Encoding", "gzip")
+            self.v1 = kubernetes.client.CoreV1Api(self.api_client)
+            self.apps_v1 = kubernetes.client.AppsV1Api(self.api_client)
+            self.batch_v1 = kubernetes.client.BatchV1Api(self.api_client)
         except Exception as e:
             # Handle network connectivity errors during client initialization
             error_str = str(e).lower()
@@ -207,39 +329,48 @@ class KubernetesEventManager:
     def _fetch_k8s_object(
         self, namespace: str, kind: str, name: str, api_version: Optional[str]
     ) -> Optional[Any]:
+        import kubernetes
+
         cache_key = (namespace, kind, name, api_version)
         if cache_key in self._object_fetch_cache:
             return self._object_fetch_cache[cache_key]
         obj = None
+        response = None
         try:
             if kind == "Pod" and (api_version == "v1" or not api_version):
-                obj = self.v1.read_namespaced_pod(name=name, namespace=namespace)
+                response = self.v1.read_namespaced_pod(
+                    name=name, namespace=namespace, _preload_content=False
+                )
             elif kind == "ReplicaSet" and api_version == "apps/v1":
-                obj = self.apps_v1.read_namespaced_replica_set(
-                    name=name, namespace=namespace
+                response = self.apps_v1.read_namespaced_replica_set(
+                    name=name, namespace=namespace, _preload_content=False
                 )
             elif kind == "Deployment" and api_version == "apps/v1":
-                obj = self.apps_v1.read_namespaced_deployment(
-                    name=name, namespace=namespace
+                response = self.apps_v1.read_namespaced_deployment(
+                    name=name, namespace=namespace, _preload_content=False
                 )
             elif kind == "StatefulSet" and api_version == "apps/v1":
-                obj = self.apps_v1.read_namespaced_stateful_set(
-                    name=name, namespace=namespace
+                response = self.apps_v1.read_namespaced_stateful_set(
+                    name=name, namespace=namespace, _preload_content=False
                 )
             elif kind == "DaemonSet" and api_version == "apps/v1":
-                obj = self.apps_v1.read_namespaced_daemon_set(
-                    name=name, namespace=namespace
+                response = self.apps_v1.read_namespaced_daemon_set(
+                    name=name, namespace=namespace, _preload_content=False
                 )
             elif kind == "Job" and api_version == "batch/v1":
-                obj = self.batch_v1.read_namespaced_job(name=name, namespace=namespace)
+                response = self.batch_v1.read_namespaced_job(
+                    name=name, namespace=namespace, _preload_content=False
+                )
             elif kind == "CronJob" and (
                 api_version == "batch/v1" or api_version == "batch/v1beta1"
             ):
-                obj = self.batch_v1.read_namespaced_cron_job(
-                    name=name, namespace=namespace
+                response = self.batch_v1.read_namespaced_cron_job(
+                    name=name, namespace=namespace, _preload_content=False
                 )
             elif kind == "Node" and (api_version == "v1" or not api_version):
-                obj = self.v1.read_node(name=name)
+                response = self.v1.read_node(name=name, _preload_content=False)
+            if response is not None:
+                obj = _object_metadata_from_json(response.data)
         except kubernetes.client.exceptions.ApiException as e:
             if e.status != 404:  # Log other errors, 404 is common if object deleted
                 # console.print(f"[yellow]API Error fetching {kind}/{name} in {namespace}: {e.status} - {e.reason}[/yellow]")
@@ -257,8 +388,48 @@ class KubernetesEventManager:
         self._object_fetch_cache[cache_key] = obj
         return obj
 
+    def _prefetch_k8s_objects(
+        self, keys: Iterable[Tuple[str, str, str, Optional[str]]]
+    ) -> None:
+        """Fetch objects and their owner chains concurrently into the fetch cache.
+
+        Each pass fetches one level of the owner hierarchy in parallel, so the
+        serial owner resolution in group_events_by_owner only hits the cache.
+        """
+        pending = {key for key in keys if key not in self._object_fetch_cache}
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # The involved objects plus up to OWNER_RESOLUTION_MAX_LEVEL owners
+            for _ in range(OWNER_RESOLUTION_MAX_LEVEL + 1):
+                fetched = list(
+                    executor.map(lambda key: self._fetch_k8s_object(*key), pending)
+                )
+                pending = set()
+                for obj in fetched:
+                    if (
+                        obj
+                        and hasattr(obj, "metadata")
+                        and obj.metadata.owner_references
+                    ):
+                        owner_ref = obj.metadata.owner_references[0]
+                        key = (
+                            obj.metadata.namespace,
+                            owner_ref.kind,
+                            owner_ref.name,
+                            owner_ref.api_version,
+                        )
+                        if key not in self._object_fetch_cache:
+                            pending.add(key)
+                if not pending:
+                    break
+
     def _get_true_owner_recursive(
-        self, namespace: str, owner_ref: Any, level: int = 0, max_level: int = 5
+        self,
+        namespace: str,
+        owner_ref: Any,
+        level: int = 0,
+        max_level: int = OWNER_RESOLUTION_MAX_LEVEL,
     ) -> Dict[str, str]:
         cache_key = (namespace, owner_ref.kind, owner_ref.name, str(owner_ref.uid))
         if cache_key in self._owner_resolution_cache:
@@ -294,7 +465,10 @@ class KubernetesEventManager:
                 "namespace": namespace,
                 "uid": str(owner_ref.uid),
             }
-            self._owner_resolution_cache[cache_key] = resolved_owner
+            # A failed lookup may succeed on the next refresh, so only cache
+            # owners whose object was actually read.
+            if obj is not None:
+                self._owner_resolution_cache[cache_key] = resolved_owner
             return resolved_owner
 
     def group_events_by_owner(
@@ -303,6 +477,19 @@ class KubernetesEventManager:
         grouped_by_owner_uid: Dict[str, Dict[str, Any]] = {}
         involved_to_final_owner_cache: Dict[Tuple, Dict[str, str]] = {}
 
+        self._prefetch_k8s_objects(
+            (
+                event.namespace,
+                event.involved_object_kind,
+                event.involved_object_name,
+                event.api_version,
+            )
+            for event in events
+            if event.involved_object_name
+            and event.involved_object_kind
+            and event.namespace
+        )
+
         for event in events:
             if (
                 not event.involved_object_name
@@ -344,9 +531,8 @@ class KubernetesEventManager:
                     )
                 elif involved_obj_full and hasattr(involved_obj_full, "metadata"):
                     effective_owner_info = {
-                        "kind": getattr(
-                            involved_obj_full, "kind", event.involved_object_kind
-                        ),
+                        "kind": getattr(involved_obj_full, "kind", None)
+                        or event.involved_object_kind,
                         "name": involved_obj_full.metadata.name,
                         "namespace": involved_obj_full.metadata.namespace,
                         "uid": str(involved_obj_full.metadata.uid),
@@ -365,79 +551,97 @@ class KubernetesEventManager:
                 continue
 
             owner_uid_str = effective_owner_info["uid"]
-            if owner_uid_str not in grouped_by_owner_uid:
-                initial_ts = event.last_timestamp or event.first_timestamp
-                initial_ts = (
-                    initial_ts.replace(tzinfo=timezone.utc)
-                    if initial_ts and initial_ts.tzinfo is None
-                    else (initial_ts or datetime.min.replace(tzinfo=timezone.utc))
-                )
-                grouped_by_owner_uid[owner_uid_str] = {
+            current_event_ts = _event_time(event)
+            # Look the group up once per event rather than once per field
+            group = grouped_by_owner_uid.get(owner_uid_str)
+            if group is None:
+                group = grouped_by_owner_uid[owner_uid_str] = {
                     "owner_info": effective_owner_info,
                     "events": [],
-                    "latest_event_timestamp": initial_ts,
+                    "latest_event_timestamp": current_event_ts or _MIN_TIMESTAMP,
                     "latest_event_type": event.type or "N/A",
-                    "latest_event_reason": event.reason or "N/A",
+                    "latest_event_reason": _format_reason(event),
                 }
 
-            grouped_by_owner_uid[owner_uid_str]["events"].append(event)
-            current_event_ts = event.last_timestamp or event.first_timestamp
-            if current_event_ts:
-                current_event_ts = (
-                    current_event_ts.replace(tzinfo=timezone.utc)
-                    if current_event_ts.tzinfo is None
-                    else current_event_ts
-                )
-                if (
-                    current_event_ts
-                    > grouped_by_owner_uid[owner_uid_str]["latest_event_timestamp"]
-                ):
-                    grouped_by_owner_uid[owner_uid_str]["latest_event_timestamp"] = (
-                        current_event_ts
-                    )
-                    grouped_by_owner_uid[owner_uid_str]["latest_event_type"] = (
-                        event.type or "N/A"
-                    )
-                    grouped_by_owner_uid[owner_uid_str]["latest_event_reason"] = (
-                        event.reason or "N/A"
-                    )
+            group["events"].append(event)
+            if current_event_ts and current_event_ts > group["latest_event_timestamp"]:
+                group["latest_event_timestamp"] = current_event_ts
+                group["latest_event_type"] = event.type or "N/A"
+                group["latest_event_reason"] = _format_reason(event)
 
         for owner_data in grouped_by_owner_uid.values():
             # Sort events based on sort_direction
             reverse_sort = sort_direction == "desc"
-            owner_data["events"].sort(
-                key=lambda e: (
-                    (e.last_timestamp or e.first_timestamp or datetime.min).replace(
-                        tzinfo=timezone.utc
-                    )
-                    if (e.last_timestamp or e.first_timestamp or datetime.min).tzinfo
-                    is None
-                    else (e.last_timestamp or e.first_timestamp or datetime.min)
-                ),
-                reverse=reverse_sort,
-            )
+            owner_data["events"].sort(key=_event_sort_key, reverse=reverse_sort)
         return grouped_by_owner_uid
 
-    def fetch_events(self, namespace: Optional[str] = None) -> List[KubernetesEvent]:
+    def _expire_caches(self) -> None:
+        """Drop cached objects and owners once they are older than cache_ttl.
+
+        Owner chains rarely change, so refreshes within the TTL reuse them and
+        only fetch objects they have not seen yet. Failed lookups are cached as
+        None and only last for one refresh, so they are always retried.
+        """
+        now = time.monotonic()
+        if now - self._cache_started_at < self.cache_ttl:
+            for cache_key in [
+                key for key, obj in self._object_fetch_cache.items() if obj is None
+            ]:
+                del self._object_fetch_cache[cache_key]
+            return
         self._object_fetch_cache.clear()
         self._owner_resolution_cache.clear()
+        self._cache_started_at = now
+
+    def _event_list_call(self, namespace: Optional[str]) -> Any:
+        """Return the API call that lists events in namespace, or in all of them.
+
+        Both are wrapped in a partial: Watch.stream picks the model to
+        deserialize into from the callable's ":rtype:" docstring, and a partial
+        has none, so watch events stay raw dicts we can parse ourselves.
+        """
+        if namespace:
+            return functools.partial(self.v1.list_namespaced_event, namespace=namespace)
+        return functools.partial(self.v1.list_event_for_all_namespaces)
+
+    def fetch_events(self, namespace: Optional[str] = None) -> List[KubernetesEvent]:
+        import kubernetes
+
+        self._expire_caches()
         try:
-            if namespace:
-                # console.print(
-                #     f"[cyan]Fetching events for namespace: {namespace}[/cyan]"
-                # )
-                events_list_response = self.v1.list_namespaced_event(
-                    namespace=namespace, watch=False, limit=500
+            # resource_version="0" lets the apiserver answer from its watch cache
+            # instead of a quorum read from etcd. The list may be a moment stale,
+            # which is fine for a read-only viewer.
+            # _preload_content=False skips building a V1Event model per item; we
+            # parse the raw JSON and read only the fields we display.
+            kwargs: Dict[str, Any] = {}
+            list_events = self._event_list_call(namespace)
+
+            # Follow continue tokens so busy namespaces are not cut off at one
+            # page. The resource version only applies to the first request;
+            # later pages are pinned by the token.
+            events: List[KubernetesEvent] = []
+            continue_token: Optional[str] = None
+            while True:
+                if continue_token:
+                    kwargs["_continue"] = continue_token
+                    kwargs.pop("resource_version", None)
+                else:
+                    kwargs["resource_version"] = "0"
+                events_list_response = list_events(
+                    watch=False,
+                    limit=EVENTS_PAGE_SIZE,
+                    _preload_content=False,
+                    **kwargs,
                 )
-            else:
-                # console.print("[cyan]Fetching events for all namespaces[/cyan]")
-                events_list_response = self.v1.list_event_for_all_namespaces(
-                    watch=False, limit=1000
+                events_list = json.loads(events_list_response.data)
+                events.extend(
+                    KubernetesEvent.from_event_json(event)
+                    for event in events_list.get("items") or []
                 )
-            return [
-                KubernetesEvent.from_v1_event(event)
-                for event in events_list_response.items
-            ]
+                continue_token = (events_list.get("metadata") or {}).get("continue")
+                if not continue_token:
+                    return events
         except kubernetes.client.exceptions.ApiException as e:
             console.print(
                 f"[red]Error fetching events (Kubernetes API): {e.status} - {e.reason}[/red]"
@@ -479,21 +683,23 @@ class KubernetesEventManager:
         kind_filter: Optional[str] = None,
         type_filter: Optional[str] = None,
     ) -> List[KubernetesEvent]:
-        filtered_events = events
-        if kind_filter:
-            filtered_events = [
-                e
-                for e in filtered_events
-                if e.involved_object_kind
-                and kind_filter.lower() in e.involved_object_kind.lower()
-            ]
-        if type_filter:
-            filtered_events = [
-                e
-                for e in filtered_events
-                if e.type and type_filter.lower() in e.type.lower()
-            ]
-        return filtered_events
+        if not kind_filter and not type_filter:
+            return events
+        # Single pass over the events with the needles lowered once up front
+        kind_needle = kind_filter.lower() if kind_filter else None
+        type_needle = type_filter.lower() if type_filter else None
+        return [
+            e
+            for e in events
+            if (
+                kind_needle is None
+                or (
+                    e.involved_object_kind
+                    and kind_needle in e.involved_object_kind.lower()
+                )
+            )
+            and (type_needle is None or (e.type and type_needle in e.type.lower()))
+        ]
 
     def display_events_table(
         self,
@@ -517,68 +723,31 @@ class KubernetesEventManager:
             border_style="dim white",
             style="white",
         )
-        table.add_column("Time", no_wrap=True)
+        # Constant colours live on the columns; only Type and Message vary per row
+        table.add_column("Time", no_wrap=True, style="cyan")
         table.add_column("Type", no_wrap=True)
-        table.add_column("Reason", no_wrap=True)
-        table.add_column("Type/Involved Object", no_wrap=True)
+        table.add_column("Reason", no_wrap=True, style="cyan")
+        table.add_column("Type/Involved Object", no_wrap=True, style="white")
         table.add_column("Message")
 
         now = datetime.now(timezone.utc)
 
         # Ensure events are sorted for display; grouping already sorts them, but this is a safeguard
-        def ensure_aware(dt: Optional[datetime]) -> datetime:
-            if dt is None:
-                return datetime.min.replace(tzinfo=timezone.utc)
-            if dt.tzinfo is None:
-                return dt.replace(tzinfo=timezone.utc)
-            return dt
-
-        # Sort events based on sort_direction
         reverse_sort = sort_direction == "desc"
-        sorted_events = sorted(
-            events,
-            key=lambda event: ensure_aware(
-                event.last_timestamp or event.first_timestamp
-            ),
-            reverse=reverse_sort,
-        )
+        sorted_events = sorted(events, key=_event_sort_key, reverse=reverse_sort)
 
         for event in sorted_events:
-            ts_to_format = event.last_timestamp or event.first_timestamp
-            if ts_to_format:
-                ts_to_format = (
-                    ts_to_format.replace(tzinfo=timezone.utc)
-                    if ts_to_format.tzinfo is None
-                    else ts_to_format
-                )
-            timestamp_str: str
-            if show_timestamps or not ts_to_format:
-                timestamp_str = str(ts_to_format) if ts_to_format else "unknown time"
-            else:
-                delta = now - ts_to_format
-                if delta.total_seconds() < 0:
-                    timestamp_str = "in future?"
-                elif delta.days > 0:
-                    timestamp_str = f"{delta.days}d ago"
-                elif delta.seconds >= 3600:
-                    timestamp_str = f"{delta.seconds // 3600}h ago"
-                elif delta.seconds >= 60:
-                    timestamp_str = f"{delta.seconds // 60}m ago"
-                else:
-                    timestamp_str = f"{delta.seconds}s ago"
+            timestamp_str = _format_event_time(_event_time(event), now, show_timestamps)
             resource_str = f"{event.involved_object_kind or 'UnknownKind'}/{event.involved_object_name or 'UnknownName'}"
+            type_style = "red" if event.type and event.type != "Normal" else "white"
+            # API-supplied strings stay wrapped in Text so "[...]" in a message
+            # is not parsed as Rich markup; our own timestamp string is safe.
             table.add_row(
-                Text(timestamp_str, style="cyan"),
-                Text(
-                    event.type or "N/A",
-                    style="red" if event.type and event.type != "Normal" else "white",
-                ),
-                Text(event.reason or "N/A", style="cyan"),
-                Text(resource_str, style="white"),
-                Text(
-                    event.message or "",
-                    style="red" if event.type and event.type != "Normal" else "white",
-                ),
+                timestamp_str,
+                Text(event.type or "N/A", style=type_style),
+                Text(_format_reason(event)),
+                Text(resource_str),
+                Text(event.message or "", style=type_style),
             )
         console.print(table)
 
@@ -587,6 +756,87 @@ class KubernetesEventManager:
                 events, show_timestamps, show_all_namespaces, sort_direction
             )
 
+    def _watch_events(
+        self,
+        namespace: Optional[str],
+        field_selector: Optional[str],
+        events_queue: "queue.Queue[Union[KubernetesEvent, Exception]]",
+        stop: threading.Event,
+    ) -> None:
+        """Put events from a watch onto events_queue until stop is set.
+
+        Runs on a background thread. Each watch request is bounded by
+        WATCH_TIMEOUT_SECONDS and resumed from the last resource version seen;
+        if that version has expired (410 Gone) we list again to get a fresh one.
+        """
+        import kubernetes
+
+        list_events = self._event_list_call(namespace)
+        kwargs: Dict[str, Any] = {}
+        if field_selector:
+            kwargs["field_selector"] = field_selector
+        resource_version: Optional[str] = None
+        watcher = kubernetes.watch.Watch()
+        while not stop.is_set():
+            try:
+                if resource_version is None:
+                    # Start from "now" so existing events are not replayed
+                    response = list_events(limit=1, _preload_content=False, **kwargs)
+                    resource_version = json.loads(response.data)["metadata"][
+                        "resourceVersion"
+                    ]
+                for item in watcher.stream(
+                    list_events,
+                    resource_version=resource_version,
+                    timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                    allow_watch_bookmarks=True,
+                    **kwargs,
+                ):
+                    if stop.is_set():
+                        break
+                    raw_event = item.get("raw_object") or {}
+                    resource_version = (raw_event.get("metadata") or {}).get(
+                        "resourceVersion", resource_version
+                    )
+                    if item.get("type") in ("ADDED", "MODIFIED"):
+                        events_queue.put(KubernetesEvent.from_event_json(raw_event))
+            except kubernetes.client.exceptions.ApiException as e:
+                if e.status == 410:
+                    resource_version = None
+                    continue
+                events_queue.put(e)
+                stop.wait(WATCH_RETRY_SECONDS)
+            except Exception as e:
+                events_queue.put(e)
+                stop.wait(WATCH_RETRY_SECONDS)
+        watcher.stop()
+
+    def _drain_watched_events(
+        self,
+        events_queue: "queue.Queue[Union[KubernetesEvent, Exception]]",
+        owner_uids: Set[str],
+    ) -> List[KubernetesEvent]:
+        """Take everything queued by _watch_events and keep our owners' events.
+
+        The watch starts from the resource version of a fresh list, so every
+        event it delivers is new. Comparing timestamps against the local clock
+        would drop real events: lastTimestamp has whole-second precision and
+        the client clock may run ahead of the apiserver.
+        """
+        new_events: List[KubernetesEvent] = []
+        while True:
+            try:
+                item = events_queue.get_nowait()
+            except queue.Empty:
+                return new_events
+            if isinstance(item, Exception):
+                console.print(
+                    f"[yellow]Event watch interrupted, reconnecting: {item}[/yellow]"
+                )
+                continue
+            if item.involved_object_uid in owner_uids:
+                new_events.append(item)
+
     def _stream_events(
         self,
         initial_events: List[KubernetesEvent],
@@ -595,12 +845,9 @@ class KubernetesEventManager:
         sort_direction: str,
     ) -> None:
         """Stream new events for the same owners as the initial events"""
-        import os
         import select
         import signal
-        import sys
         import termios
-        import time
         import tty
 
         if not initial_events:
@@ -611,6 +858,13 @@ class KubernetesEventManager:
         for event in initial_events:
             if event.involved_object_uid:
                 owner_uids.add(event.involved_object_uid)
+        # Field selectors cannot express "uid in (...)", so only a single
+        # involved object can be narrowed server-side.
+        field_selector = (
+            f"involvedObject.uid={next(iter(owner_uids))}"
+            if len(owner_uids) == 1
+            else None
+        )
 
         # Show simple streaming indicator
         console.print(
@@ -629,123 +883,79 @@ class KubernetesEventManager:
             old_settings = termios.tcgetattr(sys.stdin)
             tty.setraw(sys.stdin.fileno())
 
-        try:
-            last_check = datetime.now(timezone.utc)
+        # A background watch delivers new events as they happen; this loop only
+        # drains them between checks for the 'q' key.
+        namespace = initial_events[0].namespace
+        events_queue: "queue.Queue[Union[KubernetesEvent, Exception]]" = queue.Queue()
+        stop_watch = threading.Event()
+        threading.Thread(
+            target=self._watch_events,
+            args=(namespace, field_selector, events_queue, stop_watch),
+            daemon=True,
+        ).start()
 
+        try:
             while True:
-                # Check for user input more frequently for responsiveness
-                for _ in range(20):  # Check for 'q' key 20 times over 2 seconds
-                    if os.isatty(sys.stdin.fileno()):
-                        ready, _, _ = select.select([sys.stdin], [], [], 0.1)
-                        if ready:
-                            char = sys.stdin.read(1)
-                            if char.lower() == "q":
-                                console.print(
-                                    "\n[yellow]Event streaming stopped[/yellow]"
-                                )
-                                return
-                    time.sleep(0.1)  # Sleep for 0.1 seconds between checks
-
-                # Fetch new events
-                namespace = initial_events[0].namespace if initial_events else None
-                new_events = self.fetch_events(namespace)
-
-                # Filter to only new events for our owners
-                filtered_new_events = []
-                current_time = datetime.now(timezone.utc)
-
-                for event in new_events:
-                    event_time = event.last_timestamp or event.first_timestamp
-                    if (
-                        event_time
-                        and event_time.replace(tzinfo=timezone.utc) > last_check
-                        and event.involved_object_uid in owner_uids
-                    ):
-                        filtered_new_events.append(event)
+                if os.isatty(sys.stdin.fileno()):
+                    ready, _, _ = select.select([sys.stdin], [], [], 0.1)
+                    if ready:
+                        char = sys.stdin.read(1)
+                        if char.lower() == "q":
+                            console.print("\n[yellow]Event streaming stopped[/yellow]")
+                            return
+                else:
+                    time.sleep(0.1)
 
+                filtered_new_events = self._drain_watched_events(
+                    events_queue, owner_uids
+                )
                 if filtered_new_events:
-                    # Display new events by appending them to output
+                    # Print each batch of new events as one table, with a
+                    # marker column flagging them as new
                     now = datetime.now(timezone.utc)
+                    event_table = Table(
+                        show_header=False,
+                        box=rich.box.SIMPLE,
+                        show_lines=False,
+                        padding=(0, 1),
+                        border_style="dim white",
+                        style="white",
+                    )
+                    event_table.add_column("New", no_wrap=True, style="green")
+                    event_table.add_column("Time", no_wrap=True, style="cyan")
+                    event_table.add_column("Type", no_wrap=True)
+                    event_table.add_column("Reason", no_wrap=True, style="cyan")
+                    event_table.add_column(
+                        "Type/Involved Object", no_wrap=True, style="white"
+                    )
+                    event_table.add_column("Message")
 
                     for event in sorted(
                         filtered_new_events,
-                        key=lambda e: (
-                            e.last_timestamp or e.first_timestamp or datetime.min
-                        ),
+                        key=_event_sort_key,
                         reverse=(sort_direction == "desc"),
                     ):
-                        ts_to_format = event.last_timestamp or event.first_timestamp
-                        if ts_to_format:
-                            ts_to_format = (
-                                ts_to_format.replace(tzinfo=timezone.utc)
-                                if ts_to_format.tzinfo is None
-                                else ts_to_format
-                            )
-
-                        if show_timestamps or not ts_to_format:
-                            timestamp_str = (
-                                str(ts_to_format) if ts_to_format else "unknown time"
-                            )
-                        else:
-                            delta = now - ts_to_format
-                            if delta.total_seconds() < 0:
-                                timestamp_str = "in future?"
-                            elif delta.days > 0:
-                                timestamp_str = f"{delta.days}d ago"
-                            elif delta.seconds >= 3600:
-                                timestamp_str = f"{delta.seconds // 3600}h ago"
-                            elif delta.seconds >= 60:
-                                timestamp_str = f"{delta.seconds // 60}m ago"
-                            else:
-                                timestamp_str = f"{delta.seconds}s ago"
-
-                        # Create a single-row table for each new event to maintain table formatting
-                        event_table = Table(
-                            show_header=False,
-                            box=rich.box.SIMPLE,
-                            show_lines=False,
-                            padding=(0, 1),
-                            border_style="dim white",
-                            style="white",
+                        timestamp_str = _format_event_time(
+                            _event_time(event), now, show_timestamps
                         )
-                        event_table.add_column("Time", no_wrap=True)
-                        event_table.add_column("Type", no_wrap=True)
-                        event_table.add_column("Reason", no_wrap=True)
-                        event_table.add_column("Type/Involved Object", no_wrap=True)
-                        event_table.add_column("Message")
-
                         resource_str = f"{event.involved_object_kind or 'UnknownKind'}/{event.involved_object_name or 'UnknownName'}"
+                        type_style = (
+                            "red" if event.type and event.type != "Normal" else "white"
+                        )
                         event_table.add_row(
-                            Text(timestamp_str, style="cyan"),
-                            Text(
-                                event.type or "N/A",
-                                style=(
-                                    "red"
-                                    if event.type and event.type != "Normal"
-                                    else "white"
-                                ),
-                            ),
-                            Text(event.reason or "N/A", style="cyan"),
-                            Text(resource_str, style="white"),
-                            Text(
-                                event.message or "",
-                                style=(
-                                    "red"
-                                    if event.type and event.type != "Normal"
-                                    else "white"
-                                ),
-                            ),
+                            "▶",
+                            timestamp_str,
+                            Text(event.type or "N/A", style=type_style),
+                            Text(_format_reason(event)),
+                            Text(resource_str),
+                            Text(event.message or "", style=type_style),
                         )
-
-                        # Print with a subtle indicator that this is a new event
-                        console.print("▶", end=" ", style="green")
-                        console.print(event_table)
-
-                last_check = current_time
+                    console.print(event_table)
 
         except KeyboardInterrupt:
             console.print("\n[yellow]Event streaming stopped[/yellow]")
         finally:
+            stop_watch.set()
             # Restore terminal settings
             if old_settings:
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
@@ -762,6 +972,9 @@ class KubeEventsInteractiveSelector:
         sort_direction: str = "asc",
         polling_interval: int = 0,
     ):
+        from prompt_toolkit.key_binding import KeyBindings
+        from prompt_toolkit.styles import Style
+
         self.event_manager = event_manager
         self.namespace = namespace
         self.grouped_data: Dict[str, Dict[str, Any]] = {}
@@ -809,8 +1022,7 @@ class KubeEventsInteractiveSelector:
         return sorted(
             self.grouped_data.keys(),
             key=lambda uid: (
-                self.grouped_data[uid]["latest_event_timestamp"]
-                or datetime.min.replace(tzinfo=timezone.utc)
+                self.grouped_data[uid]["latest_event_timestamp"] or _MIN_TIMESTAMP
             ),
             reverse=sort_reverse,
         )
@@ -830,31 +1042,9 @@ class KubeEventsInteractiveSelector:
         else:
             self.selected_index = 0
 
-    def _format_relative_time(self, timestamp: Optional[datetime]) -> str:
-        if timestamp is None:
-            return "unknown time"
-        ts_aware = (
-            timestamp.replace(tzinfo=timezone.utc)
-            if timestamp.tzinfo is None
-            else timestamp
-        )
-        if self.show_timestamps:
-            return str(ts_aware)
-        now = datetime.now(timezone.utc)
-        delta = now - ts_aware
-        if delta.total_seconds() < 0:
-            return "in future?"
-        if delta.days > 0:
-            return f"{delta.days}d ago"
-        hours, remainder = divmod(int(delta.total_seconds()), 3600)
-        minutes, _ = divmod(remainder, 60)
-        if hours > 0:
-            return f"{hours}h ago"
-        if minutes > 0:
-            return f"{minutes}m ago"
-        return f"{delta.seconds}s ago"
-
-    def _get_list_content(self) -> FormattedText:
+    def _get_list_content(self) -> "FormattedText":
+        from prompt_toolkit.formatted_text import to_formatted_text
+
         lines = []
         lines.append(
             (
@@ -878,7 +1068,9 @@ Press 'f' to follow events, 'q' to quit.\n""",
         max_resource_width = 60  # Initial width for resource
         max_namespace_width = 20  # Initial width for namespace
 
-        # Calculate actual maximum widths from data
+        # Build each row's cell text once; the render loop below only styles it
+        now = datetime.now(timezone.utc)
+        rows: List[Tuple[str, str, str, str, str]] = []
         for owner_uid in self.sorted_owner_uids:
             data = self.grouped_data[owner_uid]
             owner_info = data["owner_info"]
@@ -887,23 +1079,34 @@ Press 'f' to follow events, 'q' to quit.\n""",
             )
             owner_namespace_str = owner_info.get("namespace", "cluster") or "cluster"
             reason_str = data["latest_event_reason"]
+            rows.append(
+                (
+                    owner_namespace_str,
+                    _format_event_time(
+                        data["latest_event_timestamp"], now, self.show_timestamps
+                    ),
+                    data["latest_event_type"],
+                    reason_str,
+                    resource_name_str,
+                )
+            )
 
             max_resource_width = max(max_resource_width, len(resource_name_str))
             max_namespace_width = max(max_namespace_width, len(owner_namespace_str))
             max_reason_width = max(max_reason_width, len(reason_str))
 
         # Calculate total width
-        if self.show_all_namespaces:
-            total_width = (
-                max_namespace_width
-                + max_time_width
-                + max_type_width
-                + max_reason_width
-                + max_resource_width
-                + 10
-            )
-        else:
-            total_width = (
+        def calculate_total_width() -> int:
+            if self.show_all_namespaces:
+                return (
+                    max_namespace_width
+                    + max_time_width
+                    + max_type_width
+                    + max_reason_width
+                    + max_resource_width
+                    + 10
+                )
+            return (
                 max_time_width
                 + max_type_width
                 + max_reason_width
@@ -911,26 +1114,12 @@ Press 'f' to follow events, 'q' to quit.\n""",
                 + 6
             )
 
+        total_width = calculate_total_width()
+
         # If total width exceeds 140, truncate reason column to 30 characters
         if total_width > 140:
             max_reason_width = 30
-            if self.show_all_namespaces:
-                total_width = (
-                    max_namespace_width
-                    + max_time_width
-                    + max_type_width
-                    + max_reason_width
-                    + max_resource_width
-                    + 10
-                )
-            else:
-                total_width = (
-                    max_time_width
-                    + max_type_width
-                    + max_reason_width
-                    + max_resource_width
-                    + 6
-                )
+            total_width = calculate_total_width()
 
         header_style_str = self.style_definitions["info"]
         # Create format string with dynamic widths
@@ -946,65 +1135,51 @@ Press 'f' to follow events, 'q' to quit.\n""",
         lines.append((header_style_str, header))
         lines.append((header_style_str, "-" * total_width + "\n"))
 
-        for i, owner_uid in enumerate(self.sorted_owner_uids):
-            data = self.grouped_data[owner_uid]
-            owner_info = data["owner_info"]
-            resource_name_str = (
-                f"{owner_info.get('kind', 'N/A')}/{owner_info.get('name', 'N/A')}"
-            )
-            owner_namespace_str = owner_info.get("namespace", "cluster") or "cluster"
-
-            time_str = self._format_relative_time(data["latest_event_timestamp"])
-            type_str = data["latest_event_type"]
-            reason_str = data["latest_event_reason"]
-
+        selected_style_str = self.style_definitions["selected-row"].strip()
+        normal_style_str = self.style_definitions["normal-row"].strip()
+        warning_style_str = self.style_definitions["type-warning-override-fg"]
+
+        for i, (
+            owner_namespace_str,
+            time_str,
+            type_str,
+            reason_str,
+            resource_name_str,
+        ) in enumerate(rows):
             # Truncate reason if needed
             if len(reason_str) > max_reason_width:
                 reason_str = reason_str[: max_reason_width - 3] + "..."
 
-            is_selected = i == self.selected_index
-
             other_parts_style_str = (
-                self.style_definitions["selected-row"]
-                if is_selected
-                else self.style_definitions["normal-row"]
+                selected_style_str if i == self.selected_index else normal_style_str
             )
             type_cell_style_str = other_parts_style_str
             if type_str != "Normal":
                 type_cell_style_str = (
-                    type_cell_style_str
-                    + " "
-                    + self.style_definitions["type-warning-override-fg"]
+                    type_cell_style_str + " " + warning_style_str
                 ).strip()
 
-            # Use the dynamic format string
             if self.show_all_namespaces:
-                current_line_parts = [
+                lines.append(
                     (
-                        other_parts_style_str.strip(),
+                        other_parts_style_str,
                         f"{owner_namespace_str:<{max_namespace_width}}  ",
-                    ),
-                    (other_parts_style_str.strip(), f"{time_str:<{max_time_width}}  "),
-                    (type_cell_style_str.strip(), f"{type_str:<{max_type_width}}  "),
-                    (
-                        other_parts_style_str.strip(),
-                        f"{reason_str:<{max_reason_width}}  {resource_name_str:<{max_resource_width}}\n",
-                    ),
-                ]
-            else:
-                current_line_parts = [
-                    (other_parts_style_str.strip(), f"{time_str:<{max_time_width}}  "),
-                    (type_cell_style_str.strip(), f"{type_str:<{max_type_width}}  "),
-                    (
-                        other_parts_style_str.strip(),
-                        f"{reason_str:<{max_reason_width}}  {resource_name_str:<{max_resource_width}}\n",
-                    ),
-                ]
-            lines.extend(current_line_parts)
+                    )
+                )
+            lines.append((other_parts_style_str, f"{time_str:<{max_time_width}}  "))
+            lines.append((type_cell_style_str, f"{type_str:<{max_type_width}}  "))
+            lines.append(
+                (
+                    other_parts_style_str,
+                    f"{reason_str:<{max_reason_width}}  {resource_name_str:<{max_resource_width}}\n",
+                )
+            )
 
         return to_formatted_text(cast(Any, lines))
 
     async def _refresh_data(self) -> None:
+        import asyncio
+
         if self.event_manager is None:
             return
 
@@ -1019,7 +1194,9 @@ Press 'f' to follow events, 'q' to quit.\n""",
         self._set_grouped_data(new_grouped)
 
     # Task to update the UI gradually.
-    async def _background_updater(self, app: Application) -> None:
+    async def _background_updater(self, app: "Application[Any]") -> None:
+        import asyncio
+
         # Do not create the task if polling interval is not set.
         if self.polling_interval <= 0:
             return
@@ -1072,6 +1249,12 @@ Press 'f' to follow events, 'q' to quit.\n""",
     async def run(
         self,
     ) -> Optional[Union[List[KubernetesEvent], Tuple[str, List[KubernetesEvent]]]]:
+        import asyncio
+
+        from prompt_toolkit import Application
+        from prompt_toolkit.layout import HSplit, Layout, Window
+        from prompt_toolkit.layout.controls import FormattedTextControl
+
         root_container = HSplit(
             [
                 Window(
@@ -1104,7 +1287,28 @@ Press 'f' to follow events, 'q' to quit.\n""",
         return self.result_events
 
 
-def main() -> None:
+def _max_workers_from_environment() -> int:
+    """Return KGE_MAX_WORKERS, or PREFETCH_WORKERS if it is unset or invalid."""
+    value = os.environ.get("KGE_MAX_WORKERS")
+    if value is None:
+        return PREFETCH_WORKERS
+    try:
+        max_workers = int(value)
+    except ValueError:
+        max_workers = 0
+    if max_workers < 1:
+        console.print(
+            f"Ignoring KGE_MAX_WORKERS={value!r}: expected a positive integer, "
+            f"using {PREFETCH_WORKERS}",
+            style="yellow",
+            markup=False,
+        )
+        return PREFETCH_WORKERS
+    return max_workers
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser shared by the CLI and its completion helpers."""
     parser = argparse.ArgumentParser(
         description="View Kubernetes events with an interactive list, grouped by owner."
     )
@@ -1140,6 +1344,30 @@ def main() -> None:
         default="asc",
         help="Sort events by timestamp direction: asc (oldest first) or desc (newest first) (default: asc)",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        metavar="N",
+        help=(
+            "Maximum concurrent API requests when resolving event owners "
+            f"(default: $KGE_MAX_WORKERS or {PREFETCH_WORKERS})"
+        ),
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL_SECONDS,
+        metavar="SECONDS",
+        help=(
+            "Reuse resolved event owners across refreshes for this long "
+            f"(default: {DEFAULT_CACHE_TTL_SECONDS:g}, 0 disables)"
+        ),
+    )
+    parser.add_argument(
+        "--disable-compression",
+        action="store_true",
+        help="Do not request gzip-compressed responses from the API server",
+    )
     parser.add_argument(
         "--completion",
         choices=["zsh"],
@@ -1148,10 +1376,16 @@ def main() -> None:
     # Hidden completion flags for zsh completion script
     parser.add_argument("--complete-ns", action="store_true", help=argparse.SUPPRESS)
     parser.add_argument("--complete-kind", action="store_true", help=argparse.SUPPRESS)
+    return parser
+
 
+def main() -> None:
+    parser = build_parser()
     args = parser.parse_args()
     if args.poll < 0:
         parser.error("--poll must be 0 or greater")
+    if args.cache_ttl < 0:
+        parser.error("--cache-ttl must be 0 or greater")
 
     # Handle completion script generation
     if args.completion:
@@ -1162,6 +1396,8 @@ def main() -> None:
 
     # Handle completion-specific flags
     if args.complete_ns:
+        import kubernetes
+
         try:
             kubernetes.config.load_kube_config()
             v1 = kubernetes.client.CoreV1Api()
@@ -1194,11 +1430,25 @@ def main() -> None:
             print(kind)
         sys.exit(0)
 
+    # Checked only now so a bad setting cannot break shell completion
+    if args.max_workers is None:
+        args.max_workers = _max_workers_from_environment()
+    elif args.max_workers < 1:
+        parser.error("--max-workers must be 1 or greater")
+
+    import asyncio
+
+    import kubernetes
+
     event_manager_instance: Optional[KubernetesEventManager] = None
     selected_owner_events_from_selector: Optional[List[KubernetesEvent]] = None
 
     try:
-        event_manager_instance = KubernetesEventManager()
+        event_manager_instance = KubernetesEventManager(
+            max_workers=args.max_workers,
+            cache_ttl=args.cache_ttl,
+            disable_compression=args.disable_compression,
+        )
 
         if args.all:
             namespace_arg = None
@@ -0,0 +1,54 @@
+import sys
+
+import pytest
+
+from kge.cli.main import (
+    PREFETCH_WORKERS,
+    _max_workers_from_environment,
+    build_parser,
+    main,
+)
+
+
+def test_build_parser_defaults() -> None:
+    args = build_parser().parse_args([])
+
+    assert args.all is False
+    assert args.namespace is None
+    assert args.poll == 0
+    assert args.sort_direction == "asc"
+    assert args.disable_compression is False
+    assert args.complete_ns is False
+    assert args.complete_kind is False
+
+
+def test_build_parser_accepts_hidden_completion_flags() -> None:
+    args = build_parser().parse_args(["--complete-ns", "-n", "kube-system"])
+
+    assert args.complete_ns is True
+    assert args.namespace == "kube-system"
+
+
+def test_build_parser_reads_max_workers_from_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("KGE_MAX_WORKERS", "3")
+
+    assert build_parser().parse_args([]).max_workers is None
+    assert _max_workers_from_environment() == 3
+    assert build_parser().parse_args(["--max-workers", "5"]).max_workers == 5
+
+
+def test_invalid_max_workers_environment_falls_back_to_default(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    for value in ("abc", "0"):
+        monkeypatch.setenv("KGE_MAX_WORKERS", value)
+        assert _max_workers_from_environment() == PREFETCH_WORKERS
+
+        # Shell completion never looks at the setting
+        monkeypatch.setattr(sys, "argv", ["kge", "--complete-kind"])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 0
+        assert "Pod" in capsys.readouterr().out.splitlines()
@@ -0,0 +1,448 @@
+import dataclasses
+import json
+import queue
+import threading
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+from kge.cli.main import (
+    KubernetesEvent,
+    KubernetesEventManager,
+    _format_event_time,
+    _format_reason,
+)
+
+
+def make_event(
+    name: str,
+    uid: str,
+    kind: str = "Pod",
+    api_version: str = "v1",
+    timestamp: Optional[datetime] = None,
+    event_type: str = "Normal",
+) -> KubernetesEvent:
+    return KubernetesEvent(
+        namespace="default",
+        involved_object_name=name,
+        involved_object_kind=kind,
+        reason="TestReason",
+        message="Test message",
+        first_timestamp=None,
+        last_timestamp=timestamp,
+        api_version=api_version,
+        type=event_type,
+        count=1,
+        involved_object_uid=uid,
+    )
+
+
+def make_object(
+    kind: str, name: str, uid: str, owner: Optional[Tuple[str, str, str, str]] = None
+) -> Dict[str, Any]:
+    metadata: Dict[str, Any] = {"name": name, "namespace": "default", "uid": uid}
+    if owner:
+        owner_kind, owner_name, owner_uid, owner_api_version = owner
+        metadata["ownerReferences"] = [
+            {
+                "kind": owner_kind,
+                "name": owner_name,
+                "uid": owner_uid,
+                "apiVersion": owner_api_version,
+            }
+        ]
+    return {"kind": kind, "metadata": metadata}
+
+
+def raw_response(obj: Dict[str, Any]) -> SimpleNamespace:
+    return SimpleNamespace(data=json.dumps(obj).encode())
+
+
+class FakeCoreV1Api:
+    def __init__(self, pods: List[Dict[str, Any]]) -> None:
+        self.pods = {pod["metadata"]["name"]: pod for pod in pods}
+        self.calls: List[Tuple[str, str]] = []
+
+    def read_namespaced_pod(self, name: str, namespace: str, **kwargs: Any) -> Any:
+        self.calls.append(("Pod", name))
+        return raw_response(self.pods[name])
+
+
+class FakeAppsV1Api:
+    def __init__(
+        self,
+        replica_sets: List[Dict[str, Any]],
+        deployments: List[Dict[str, Any]],
+    ) -> None:
+        self.replica_sets = {rs["metadata"]["name"]: rs for rs in replica_sets}
+        self.deployments = {d["metadata"]["name"]: d for d in deployments}
+        self.calls: List[Tuple[str, str]] = []
+
+    def read_namespaced_replica_set(
+        self, name: str, namespace: str, **kwargs: Any
+    ) -> Any:
+        self.calls.append(("ReplicaSet", name))
+        return raw_response(self.replica_sets[name])
+
+    def read_namespaced_deployment(
+        self, name: str, namespace: str, **kwargs: Any
+    ) -> Any:
+        self.calls.append(("Deployment", name))
+        return raw_response(self.deployments[name])
+
+
+@pytest.fixture
+def manager(monkeypatch: pytest.MonkeyPatch) -> KubernetesEventManager:
+    monkeypatch.setattr(
+        KubernetesEventManager, "_init_kubernetes_client", lambda self: None
+    )
+    event_manager = KubernetesEventManager()
+    event_manager.v1 = FakeCoreV1Api(
+        [
+            make_object(
+                "Pod", "web-1", "pod-1", ("ReplicaSet", "web-rs", "rs-uid", "apps/v1")
+            ),
+            make_object(
+                "Pod", "web-2", "pod-2", ("ReplicaSet", "web-rs", "rs-uid", "apps/v1")
+            ),
+            make_object("Pod", "standalone", "pod-3"),
+        ]
+    )
+    event_manager.apps_v1 = FakeAppsV1Api(
+        [
+            make_object(
+                "ReplicaSet",
+                "web-rs",
+                "rs-uid",
+                ("Deployment", "web", "deploy-uid", "apps/v1"),
+            )
+        ],
+        [make_object("Deployment", "web", "deploy-uid")],
+    )
+    return event_manager
+
+
+def test_group_events_by_owner_resolves_top_level_owner(
+    manager: KubernetesEventManager,
+) -> None:
+    older = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    newer = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    events = [
+        make_event("web-1", "pod-1", timestamp=older),
+        make_event("web-2", "pod-2", timestamp=newer, event_type="Warning"),
+        make_event("standalone", "pod-3", timestamp=older),
+    ]
+
+    grouped = manager.group_events_by_owner(events)
+
+    assert set(grouped) == {"deploy-uid", "pod-3"}
+    assert grouped["deploy-uid"]["owner_info"]["name"] == "web"
+    assert grouped["deploy-uid"]["latest_event_timestamp"] == newer
+    assert grouped["deploy-uid"]["latest_event_type"] == "Warning"
+    assert [e.involved_object_name for e in grouped["deploy-uid"]["events"]] == [
+        "web-1",
+        "web-2",
+    ]
+
+
+def test_group_events_by_owner_fetches_each_object_once(
+    manager: KubernetesEventManager,
+) -> None:
+    events = [
+        make_event("web-1", "pod-1"),
+        make_event("web-1", "pod-1"),
+        make_event("web-2", "pod-2"),
+    ]
+
+    manager.group_events_by_owner(events)
+
+    assert sorted(manager.v1.calls) == [("Pod", "web-1"), ("Pod", "web-2")]
+    assert sorted(manager.apps_v1.calls) == [
+        ("Deployment", "web"),
+        ("ReplicaSet", "web-rs"),
+    ]
+
+
+def test_fetch_events_parses_raw_event_list(
+    manager: KubernetesEventManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    event_list = {
+        "items": [
+            {
+                "metadata": {"namespace": "default"},
+                "involvedObject": {
+                    "kind": "Pod",
+                    "name": "web-1",
+                    "apiVersion": "v1",
+                    "uid": "pod-1",
+                },
+                "reason": "BackOff",
+                "message": "Back-off restarting failed container",
+                "firstTimestamp": "2026-01-01T00:00:00Z",
+                "lastTimestamp": "2026-01-01T00:05:00Z",
+                "type": "Warning",
+                "count": 3,
+            }
+        ],
+        "metadata": {},
+    }
+    monkeypatch.setattr(
+        manager.v1,
+        "list_namespaced_event",
+        lambda **kwargs: raw_response(event_list),
+        raising=False,
+    )
+
+    events = manager.fetch_events("default")
+
+    assert events == [
+        KubernetesEvent(
+            namespace="default",
+            involved_object_name="web-1",
+            involved_object_kind="Pod",
+            reason="BackOff",
+            message="Back-off restarting failed container",
+            first_timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            last_timestamp=datetime(2026, 1, 1, 0, 5, tzinfo=timezone.utc),
+            api_version="v1",
+            type="Warning",
+            count=3,
+            involved_object_uid="pod-1",
+        )
+    ]
+
+
+def test_filter_events_matches_kind_and_type_case_insensitively(
+    manager: KubernetesEventManager,
+) -> None:
+    events = [
+        make_event("web-1", "pod-1", event_type="Warning"),
+        make_event("web-2", "pod-2", event_type="Normal"),
+        make_event("web", "deploy-uid", kind="Deployment", event_type="Warning"),
+    ]
+
+    assert manager.filter_events(events) is events
+    assert [
+        e.involved_object_uid
+        for e in manager.filter_events(events, kind_filter="pod", type_filter="warn")
+    ] == ["pod-1"]
+
+
+def test_format_event_time_relative_and_absolute() -> None:
+    now = datetime(2026, 1, 2, 12, 0, tzinfo=timezone.utc)
+
+    assert _format_event_time(None, now, False) == "unknown time"
+    assert _format_event_time(datetime(2026, 1, 1, 11, 0), now, False) == "1d ago"
+    assert _format_event_time(datetime(2026, 1, 2, 9, 30), now, False) == "2h ago"
+    assert _format_event_time(datetime(2026, 1, 2, 11, 55), now, False) == "5m ago"
+    assert _format_event_time(datetime(2026, 1, 2, 13, 0), now, False) == "in future?"
+    assert (
+        _format_event_time(datetime(2026, 1, 2, 9, 30), now, True)
+        == "2026-01-02 09:30:00+00:00"
+    )
+
+
+def test_fetch_events_follows_continue_tokens(
+    manager: KubernetesEventManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def raw_event(name: str) -> Dict[str, Any]:
+        return {
+            "metadata": {"namespace": "default"},
+            "involvedObject": {"kind": "Pod", "name": name, "uid": name},
+        }
+
+    pages = {
+        None: {"items": [raw_event("web-1")], "metadata": {"continue": "page-2"}},
+        "page-2": {"items": [raw_event("web-2")], "metadata": {}},
+    }
+    calls: List[Dict[str, Any]] = []
+
+    def list_event_for_all_namespaces(**kwargs: Any) -> SimpleNamespace:
+        calls.append(kwargs)
+        return raw_response(pages[kwargs.get("_continue")])
+
+    monkeypatch.setattr(
+        manager.v1,
+        "list_event_for_all_namespaces",
+        list_event_for_all_namespaces,
+        raising=False,
+    )
+
+    events = manager.fetch_events()
+
+    assert [e.involved_object_name for e in events] == ["web-1", "web-2"]
+    assert calls[0]["resource_version"] == "0"
+    assert "resource_version" not in calls[1]
+
+
+class FakeWatchResponse:
+    """A streaming response that replays newline-delimited watch events."""
+
+    def __init__(self, watch_events: List[Dict[str, Any]]) -> None:
+        self.watch_events = watch_events
+
+    def stream(self, amt: Any = None, decode_content: Any = None) -> Iterator[bytes]:
+        for watch_event in self.watch_events:
+            yield json.dumps(watch_event).encode() + b"\n"
+
+    def close(self) -> None:
+        pass
+
+    def release_conn(self) -> None:
+        pass
+
+
+def test_watch_events_queues_changes_and_relists_after_410(
+    manager: KubernetesEventManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    stop = threading.Event()
+    list_versions = iter(["10", "20"])
+    watch_versions: List[str] = []
+
+    def list_namespaced_event(**kwargs: Any) -> Any:
+        if not kwargs.get("watch"):
+            return raw_response(
+                {"items": [], "metadata": {"resourceVersion": next(list_versions)}}
+            )
+        watch_versions.append(kwargs["resource_version"])
+        if len(watch_versions) > 1:
+            stop.set()
+            return FakeWatchResponse([])
+        return FakeWatchResponse(
+            [
+                {
+                    "type": "ADDED",
+                    "object": {
+                        "metadata": {"namespace": "default", "resourceVersion": "11"},
+                        "involvedObject": {
+                            "kind": "Pod",
+                            "name": "web-1",
+                            "uid": "pod-1",
+                        },
+                    },
+                },
+                {
+                    "type": "BOOKMARK",
+                    "object": {"metadata": {"resourceVersion": "12"}},
+                },
+                {
+                    "type": "ERROR",
+                    "object": {
+                        "kind": "Status",
+                        "code": 410,
+                        "reason": "Expired",
+                        "message": "too old resource version: 12 (30)",
+                    },
+                },
+            ]
+        )
+
+    monkeypatch.setattr(
+        manager.v1, "list_namespaced_event", list_namespaced_event, raising=False
+    )
+    events_queue: "queue.Queue[Any]" = queue.Queue()
+
+    manager._watch_events("default", None, events_queue, stop)
+
+    # The expired watch is replaced by a fresh list, not retried at "12"
+    assert watch_versions == ["10", "20"]
+    assert events_queue.get_nowait().involved_object_uid == "pod-1"
+    assert events_queue.empty()
+
+
+def test_drain_watched_events_keeps_events_from_the_same_second(
+    manager: KubernetesEventManager,
+) -> None:
+    # lastTimestamp has whole-second precision, so an event from the second
+    # follow mode started in parses to a time just before "now"
+    same_second = datetime.now(timezone.utc).replace(microsecond=0)
+    events_queue: "queue.Queue[Any]" = queue.Queue()
+    events_queue.put(make_event("web-1", "pod-1", timestamp=same_second))
+    events_queue.put(make_event("other", "pod-9", timestamp=same_second))
+    events_queue.put(RuntimeError("connection reset"))
+
+    new_events = manager._drain_watched_events(events_queue, {"pod-1"})
+
+    assert [e.involved_object_uid for e in new_events] == ["pod-1"]
+    assert events_queue.empty()
+
+
+def test_fetch_events_reuses_owner_cache_within_ttl(
+    manager: KubernetesEventManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        manager.v1,
+        "list_namespaced_event",
+        lambda **kwargs: raw_response({"items": [], "metadata": {}}),
+        raising=False,
+    )
+    events = [make_event("standalone", "pod-3")]
+
+    manager.group_events_by_owner(events)
+    manager.fetch_events("default")
+    manager.group_events_by_owner(events)
+    assert manager.v1.calls == [("Pod", "standalone")]
+
+    manager.cache_ttl = 0
+    manager.fetch_events("default")
+    manager.group_events_by_owner(events)
+    assert manager.v1.calls == [("Pod", "standalone")] * 2
+
+
+def test_fetch_events_retries_failed_owner_lookups_within_ttl(
+    manager: KubernetesEventManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        manager.v1,
+        "list_namespaced_event",
+        lambda **kwargs: raw_response({"items": [], "metadata": {}}),
+        raising=False,
+    )
+    events = [make_event("web-1", "pod-1")]
+    pod = manager.v1.pods.pop("web-1")
+
+    assert set(manager.group_events_by_owner(events)) == {"pod-1"}
+
+    manager.v1.pods["web-1"] = pod
+    manager.fetch_events("default")
+    assert set(manager.group_events_by_owner(events)) == {"deploy-uid"}
+    assert manager.v1.calls == [("Pod", "web-1")] * 2
+
+
+def test_format_reason_shows_repeat_count() -> None:
+    event = make_event("web-1", "pod-1")
+
+    assert _format_reason(event) == "TestReason"
+    assert _format_reason(dataclasses.replace(event, count=12)) == "TestReason (x12)"
+
+    series_event = KubernetesEvent.from_event_json(
+        {"reason": "BackOff", "count": 1, "series": {"count": 7}}
+    )
+    assert _format_reason(series_event) == "BackOff (x7)"
+
+
+def test_group_events_by_owner_shows_repeat_count_in_latest_reason(
+    manager: KubernetesEventManager,
+) -> None:
+    events = [dataclasses.replace(make_event("standalone", "pod-3"), count=4)]
+
+    grouped = manager.group_events_by_owner(events)
+
+    assert grouped["pod-3"]["latest_event_reason"] == "TestReason (x4)"
+
+
+def test_api_client_requests_gzip_unless_compression_is_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import kubernetes  # type: ignore[import-untyped]
+
+    monkeypatch.setattr(kubernetes.config, "load_incluster_config", lambda: None)
+    monkeypatch.setattr(kubernetes.config, "load_kube_config", lambda: None)
+
+    compressed = KubernetesEventManager()
+    uncompressed = KubernetesEventManager(disable_compression=True)
+
+    assert compressed.api_client.default_headers["Accept-Encoding"] == "gzip"
+    assert "Accept-Encoding" not in uncompressed.api_client.default_headers